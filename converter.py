@@ -1,17 +1,25 @@
 import argparse
 import csv
+import importlib
 import os
 
+import numpy as np
 import pandas as pd
 from babel.numbers import parse_decimal
 
+# converter type -> (module, class); modules are imported lazily as they depend on this one
+CONVERTERS = {
+    "ibkr": ("ibkr_converter", "IbkrConverter"),
+    "schwab": ("schwab_converter", "SchwabConverter"),
+}
+
 parser = argparse.ArgumentParser(
     description="Convert Interactive Brokers and Schwab CSV output to XLSX for later processing"
 )
 parser.add_argument(
     "type",
     type=str,
-    choices=["ibkr", "schwab"],
+    choices=list(CONVERTERS),
     help="Type of the CSV format for input",
 )
 parser.add_argument(
@@ -43,10 +51,16 @@ class Converter:
         self.xlsx_filename = args.xlsx_filename
         self.isin_replace = args.isin_replace
 
-        self.df_deposits = pd.DataFrame(columns=["date", "symbol", "net_quantity", "fmv_or_buy_price", "fees", "currency", "Product"])
-        self.df_sales = pd.DataFrame(columns=["date", "symbol", "quantity", "sell_price", "fees", "currency", "Product"])
-        self.df_dividends = pd.DataFrame(columns=["date", "symbol", "amount", "tax_withholding", "currency", "Product"])
-        self.df_forex_to_eur = pd.DataFrame(columns=["date", "net_amount", "fees", "currency"])
+        # rows are collected column-wise and only converted to data-frames once the whole CSV is processed
+        self.deposits = {c: [] for c in ["date", "symbol", "net_quantity", "fmv_or_buy_price", "fees", "currency", "Product"]}
+        self.sales = {c: [] for c in ["date", "symbol", "quantity", "sell_price", "fees", "currency", "Product"]}
+        self.dividends = {c: [] for c in ["date", "symbol", "amount", "tax_withholding", "currency", "Product"]}
+        self.forex_to_eur = {c: [] for c in ["date", "net_amount", "fees", "currency"]}
+
+        self.df_deposits = None
+        self.df_sales = None
+        self.df_dividends = None
+        self.df_forex_to_eur = None
 
         self.row = ''
         self.skip_dividend_section = False
@@ -65,8 +79,10 @@ class Converter:
                 self._process_dividends()
                 self._process_instrument_information()
 
-            for df in [self.df_deposits, self.df_sales, self.df_dividends, self.df_forex_to_eur]:
-                df.sort_values("date", inplace=True)
+            self.df_deposits = self._sort_by_date(pd.DataFrame(self.deposits))
+            self.df_sales = self._sort_by_date(pd.DataFrame(self.sales))
+            self.df_dividends = self._sort_by_date(pd.DataFrame(self.dividends))
+            self.df_forex_to_eur = self._sort_by_date(pd.DataFrame(self.forex_to_eur))
 
             print(f"Total processed trades: {self.processed_trades}")
             print(f"Total processed dividends: {self.processed_dividends}")
@@ -88,6 +104,16 @@ class Converter:
         worksheet = writer.sheets[name]
         worksheet.autofit()  # Adjust column widths to their maximum lengths
 
+    @staticmethod
+    def _sort_by_date(df: pd.DataFrame):
+        # stable sort, i.e. rows of the same day keep their order from the CSV
+        return df.take(np.argsort(df["date"].to_numpy(), kind="stable"))
+
+    @staticmethod
+    def _append_row(table: dict, row: list):
+        for column, value in zip(table.values(), row):
+            column.append(value)
+
     @staticmethod
     def _parse_number(string):
         return float(parse_decimal(string, locale="en_US", strict=True))
@@ -106,15 +132,12 @@ class Converter:
 
 
 def main(args):
-    if args.type == "ibkr":
-        from ibkr_converter import IbkrConverter
-        converter = IbkrConverter(args)
-    elif args.type == "schwab":
-        from schwab_converter import SchwabConverter
-        converter = SchwabConverter(args)
-    else:
+    if args.type not in CONVERTERS:
         raise ValueError("This type of converter is not recognised")
 
+    module_name, class_name = CONVERTERS[args.type]
+    converter = getattr(importlib.import_module(module_name), class_name)(args)
+
     converter.process_csv()
     converter.write_to_xlsx()
 
@@ -1,9 +1,20 @@
 # class for representing a foreign currency to cover dividend payments, fees, quellensteuer, etc.
 # these are separated from FIFO treatments of foreign currencies
 import math
+from bisect import bisect_left
+from collections import deque
 
 
 class Forex:
+    __slots__ = (
+        "currency",
+        "date",
+        "amount",
+        "amount_eur_daily",
+        "amount_eur_monthly",
+        "comment",
+    )
+
     def __init__(self, currency, date, amount, comment):
         self.currency = currency
         self.date = date
@@ -41,6 +52,23 @@ class Forex:
 
 # base class representing an arbitrary asset subject to FIFO treatment
 class FIFOObject:
+    # a report holds one object per lot of shares or currency, slots keep them small
+    __slots__ = (
+        "symbol",
+        "currency",
+        "quantity",
+        "buy_date",
+        "sell_date",
+        "buy_price",
+        "buy_price_eur_daily",
+        "buy_price_eur_monthly",
+        "sell_price",
+        "sell_price_eur_daily",
+        "sell_price_eur_monthly",
+        "gain_eur_daily",
+        "gain_eur_monthly",
+    )
+
     def __init__(self, symbol, quantity, buy_date, buy_price, currency):
         self.symbol = symbol
         self.currency = currency
@@ -60,6 +88,8 @@ class FIFOObject:
 
 
 class FIFOForex(FIFOObject):
+    __slots__ = ("source",)
+
     def __init__(self, currency, quantity, buy_date, source):
         # "money" is always a single unit "money"
         super().__init__(currency, quantity, buy_date, 1, currency)
@@ -106,6 +136,8 @@ class FIFOForex(FIFOObject):
 
 # class representing a share subject to FIFO treatment
 class FIFOShare(FIFOObject):
+    __slots__ = ()
+
     def __init__(self, symbol, quantity, buy_date, buy_price, currency):
         super().__init__(symbol, quantity, buy_date, buy_price, currency)
 
@@ -129,20 +161,18 @@ class FIFOShare(FIFOObject):
 
 class FIFOQueue:
     def __init__(self):
-        self.assets = []
+        # assets are consumed from the front, deque avoids shifting the remaining ones on every pop
+        self.assets = deque()
+        # buy dates of "assets" in the same order, cached for the binary search in "push"
+        self.buy_dates = deque()
         self.total_quantity = 0
 
     def push(self, asset):
-        if self.is_empty():
-            self.assets = [asset]
-        else:
-            # insert based on buy date ("first in")
-            idx = 0
-            while (idx < len(self.assets)) and (
-                asset.buy_date > self.assets[idx].buy_date
-            ):
-                idx += 1
-            self.assets.insert(idx, asset)
+        # insert based on buy date ("first in"), i.e. before the first asset
+        # bought on the same day or later
+        idx = bisect_left(self.buy_dates, asset.buy_date)
+        self.assets.insert(idx, asset)
+        self.buy_dates.insert(idx, asset.buy_date)
         self.total_quantity += asset.quantity
 
     def is_empty(self):
@@ -190,17 +220,19 @@ class FIFOQueue:
             return [pop_asset]
         elif quantity == front_quantity:
             self.total_quantity -= quantity
-            return [self.assets.pop(0)]
+            self.buy_dates.popleft()
+            return [self.assets.popleft()]
         else:
             # quantity is larger
             # pop first item, then call pop on remaining quantity
-            pop_asset = self.assets.pop(0)
+            self.buy_dates.popleft()
+            pop_asset = self.assets.popleft()
             self.total_quantity -= pop_asset.quantity
             remaining_quantity = quantity - pop_asset.quantity
             return [pop_asset] + self.pop(remaining_quantity, sell_date)
 
     def __repr__(self):
-        return self.assets.__repr__()
+        return list(self.assets).__repr__()
 
 
 def from_asset(asset, quantity):
@@ -37,8 +37,8 @@ class IbkrConverter(Converter):
             return False
 
         quantity = self._parse_number(self.row[8])
-        df = self.df_deposits if quantity > 0 else self.df_sales
-        df.loc[len(df.index)] = [
+        table = self.deposits if quantity > 0 else self.sales
+        self._append_row(table, [
             date.fromisoformat(self.row[6].split(',')[0]),  # Date
             self.row[5],  # Symbol
             abs(quantity),  # Quantity
@@ -46,7 +46,7 @@ class IbkrConverter(Converter):
             abs(self._parse_number(self.row[12])),  # Comm/Fee
             self.row[4],  # Currency
             self.row[5],  # Symbol
-        ]
+        ])
 
         return True
 
@@ -78,12 +78,12 @@ class IbkrConverter(Converter):
         if self.row[2] != "Order" or self.row[4] == "EUR":  # pyFIFOtax spreadsheet supports only conversion into EUR
             return False
 
-        self.df_forex_to_eur.loc[len(self.df_forex_to_eur.index)] = [
+        self._append_row(self.forex_to_eur, [
             date.fromisoformat(self.row[6].split(',')[0]),  # Date
             abs(self._parse_number(self.row[11])),  # Proceeds
             abs(self._parse_number(self.row[12]) * self._parse_number(self.row[9])),  # Comm in EUR * T. Price
             self.row[4],  # Symbol
-        ]
+        ])
 
         return True
 
@@ -122,14 +122,14 @@ class IbkrConverter(Converter):
             return False
 
         symbol = self.row[4].split(' ')[0]
-        self.df_dividends.loc[len(self.df_dividends.index)] = [
+        self._append_row(self.dividends, [
             date.fromisoformat(self.row[3]),  # Date
             symbol,
             self._parse_number(self.row[5]),  # Amount
             0,  # Tax withholding
             self.row[2],  # Currency
             symbol,
-        ]
+        ])
 
         return True
 
@@ -164,8 +164,8 @@ class IbkrConverter(Converter):
         isin = self.row[6]
         product = self.row[4]
 
-        for df in [self.df_deposits, self.df_sales, self.df_dividends]:
+        for table in [self.deposits, self.sales, self.dividends]:
             if self.isin_replace:
-                df.loc[df["symbol"] == symbol, "symbol"] = isin
+                table["symbol"] = [isin if s == symbol else s for s in table["symbol"]]
 
-            df.loc[df["Product"] == symbol, "Product"] = product
+            table["Product"] = [product if p == symbol else p for p in table["Product"]]
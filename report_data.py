@@ -192,11 +192,11 @@ class ReportData:
             self.add_fees(row, f"Buying {row.symbol}")
             symbol, new_shares = FIFOShare.from_deposits_row(row)
 
-            if symbol in self.held_shares and not self.held_shares[symbol].is_empty():
-                if self.held_shares[symbol].assets[-1].currency != row.currency:
-                    raise NotImplementedError(f"It is not yet supported to buy the same symbol ('{row.symbol}') in different currencies")
+            held_shares = self.held_shares[symbol]
+            if not held_shares.is_empty() and held_shares.assets[-1].currency != row.currency:
+                raise NotImplementedError(f"It is not yet supported to buy the same symbol ('{row.symbol}') in different currencies")
 
-            self.held_shares[symbol].push(new_shares)
+            held_shares.push(new_shares)
 
     def process_dividends(self, df_dividends):
         for row_idx, row in df_dividends.iterrows():
@@ -1,4 +1,5 @@
-from datetime import datetime
+from datetime import date
+from functools import lru_cache
 from types import SimpleNamespace
 
 from converter import Converter
@@ -19,6 +20,13 @@ class SchwabConverter(Converter):
              'withholding': 0.0,
          })
 
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _parse_date(string: str):
+        # Dates are in "%m/%d/%Y", splitting is much faster than datetime.strptime and most rows share a few dates
+        month, day, year = string.split('/')
+        return date(int(year), int(month), int(day))
+
     def _parse_usd(self, string: str):
         return self._parse_number(string.replace('$', ''))
 
@@ -53,14 +61,14 @@ class SchwabConverter(Converter):
 
     def _process_trade_row(self):
         if self.row[1] in ["Deposit", "Sale"]:
-            date = datetime.strptime(self.row[0], "%m/%d/%Y").date()  # Date
+            trade_date = self._parse_date(self.row[0])  # Date
             symbol = self.row[2]  # Symbol
             commission = self._parse_usd('0' if not self.row[5] else self.row[5])  # FeesAndCommissions
             quantity = self._parse_number(self.row[4])  # Quantity
 
             self.trade_in_progress.type = [self.row[1], self.row[3]]
             self.trade_in_progress.row = [
-                date,
+                trade_date,
                 symbol,
                 quantity,
                 None,
@@ -75,20 +83,20 @@ class SchwabConverter(Converter):
             return False
         else:
             if self.trade_in_progress.type[0] == "Deposit":
-                df = self.df_deposits
+                table = self.deposits
                 if self.trade_in_progress.type[1] == "RS":  # RSU and ESPP FMV columns are different
                     transaction_price = self._parse_usd(self.row[17])
                 else:
                     transaction_price = self._parse_usd(self.row[12])
             else:
-                df = self.df_sales
+                table = self.sales
                 transaction_price = self._parse_usd(self.row[22])  # SalePrice
                 quantity = self._parse_number(self.row[9])
                 self.trade_in_progress.row[2] = quantity  # Itemised share quantity
                 self.trade_in_progress.row[4] = quantity * self.trade_in_progress.commission_per_share  # Commission
 
             self.trade_in_progress.row[3] = transaction_price
-            df.loc[len(df.index)] = self.trade_in_progress.row
+            self._append_row(table, self.trade_in_progress.row)
 
             return True
 
@@ -107,7 +115,7 @@ class SchwabConverter(Converter):
     def _process_dividend_row(self):
         if self.row[1] == "Dividend":
             self.dividend_in_progress.row = [
-                datetime.strptime(self.row[0], "%m/%d/%Y").date(),  # Date
+                self._parse_date(self.row[0]),  # Date
                 self.row[2],  # Symbol
                 self._parse_usd(self.row[7]),  # Amount
                 None,
@@ -120,7 +128,7 @@ class SchwabConverter(Converter):
         # It's unpredictable whether "Dividend" or "Tax Withholding" comes first in the CSV
         if self.dividend_in_progress.row and self.dividend_in_progress.withholding > 0:
             self.dividend_in_progress.row[3] = self.dividend_in_progress.withholding
-            self.df_dividends.loc[len(self.df_dividends.index)] = self.dividend_in_progress.row
+            self._append_row(self.dividends, self.dividend_in_progress.row)
 
             return True
 
@@ -1,8 +1,10 @@
 import pytest
 from numpy.testing import assert_allclose
 
+import pandas as pd
+
 from report_data import ReportData
-from utils import summarize_report
+from utils import get_daily_rate, get_reference_rates, summarize_report
 
 
 def get_elster_summary(file_name, year, mode):
@@ -52,3 +54,13 @@ exception_outputs = [
 def test_summarize_exception(file_name, error_msg):
     with pytest.raises(ValueError, match=error_msg):
         get_elster_summary(file_name, 2022, "daily")
+
+
+def test_get_daily_rate_weekend():
+    daily_rates, _, _ = get_reference_rates()
+    friday = daily_rates["USD"][pd.Timestamp("2022-03-04")]
+    # weekend and public holidays fall back to the latest preceding rate
+    assert get_daily_rate(daily_rates, "USD", pd.Timestamp("2022-03-04")) == friday
+    assert get_daily_rate(daily_rates, "USD", pd.Timestamp("2022-03-06")) == friday
+    with pytest.raises(ValueError, match="cannot be found"):
+        get_daily_rate(daily_rates, "USD", pd.Timestamp("1999-01-01"))
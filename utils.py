@@ -9,19 +9,21 @@ def get_date(forex):
 
 
 def get_reference_rates():
-    daily_ex_rates = pd.read_csv("eurofxref-hist.csv")
-    daily_ex_rates = daily_ex_rates.loc[
-        :, ~daily_ex_rates.columns.str.contains("^Unnamed")
-    ]
-    daily_ex_rates.index = pd.to_datetime(daily_ex_rates["Date"], format="%Y-%m-%d")
+    daily_ex_rates = pd.read_csv(
+        "eurofxref-hist.csv",
+        # skip the empty column from the trailing comma of each line while parsing
+        usecols=lambda c: not c.startswith("Unnamed"),
+        index_col="Date",
+        parse_dates=["Date"],
+    )
     # drop years earlier as 2009 as this would make reporting tax earning
     # way more complicated anyway
     daily_ex_rates = daily_ex_rates.loc[daily_ex_rates.index.year >= 2009]
     # drop columns with nan values
     daily_ex_rates = daily_ex_rates.dropna(axis="columns")
 
-    daily_ex_rates = daily_ex_rates.drop("Date", axis="columns")
-    daily_ex_rates = daily_ex_rates
+    # ascending dates allow for a binary search of the latest valid rate
+    daily_ex_rates = daily_ex_rates.sort_index()
     monthly_ex_rates = daily_ex_rates.groupby(
         by=[daily_ex_rates.index.year, daily_ex_rates.index.month]
     ).mean()
@@ -148,31 +150,38 @@ def write_report(
         create_report_sheet("ELSTER - Summary", df_summary, writer)
 
 
+def get_daily_rate(daily_rates, currency, date):
+    # On weekends the currency exchange doesn't operate. Go back some days in time to find a valid value,
+    # i.e. take the latest rate on or before the given date (dates are sorted in ascending order)
+    rates = daily_rates[currency]
+    idx = rates.index.searchsorted(date, side="right") - 1
+    if idx < 0 or (date - rates.index[idx]) >= timedelta(days=7):
+        raise ValueError(
+            f"{currency} currency exchange rate cannot be found for {date} or "
+            "the preceding seven days"
+        )
+    return rates.iloc[idx]
+
+
+def get_rates(currency, date, daily_rates, monthly_rates):
+    # exchange rates are in 1 EUR : X FOREX
+    if currency == "EUR":
+        return 1, 1
+
+    return (
+        get_daily_rate(daily_rates, currency, date),
+        monthly_rates[currency][date.year, date.month],
+    )
+
+
 def apply_rates_forex_dict(forex_dict, daily_rates, monthly_rates):
     for _, v in forex_dict.items():
         for f in v:
-            if f.currency == "EUR":
-                f.amount_eur_daily = f.amount
-                f.amount_eur_monthly = f.amount
-            else:
-                # exchange rates are in 1 EUR : X FOREX
-                day = f.date
-                if f.date not in daily_rates[f.currency]:
-                    # On weekends the currency exchange doesn't operate. Go back some days in time to find a valid value
-                    for day_reduce in range(1, 7):
-                        day = f.date - timedelta(days=day_reduce)
-                        if day in daily_rates[f.currency]:
-                            break
-                        else:
-                            raise ValueError(
-                                f"{f.currency} currency exchange rate cannot be found for {f.date} or "
-                                "the preceding seven days"
-                            )
-
-                f.amount_eur_daily = f.amount / daily_rates[f.currency][day]
-                f.amount_eur_monthly = (
-                    f.amount / monthly_rates[f.currency][f.date.year, f.date.month]
-                )
+            rate_daily, rate_monthly = get_rates(
+                f.currency, f.date, daily_rates, monthly_rates
+            )
+            f.amount_eur_daily = f.amount / rate_daily
+            f.amount_eur_monthly = f.amount / rate_monthly
 
 
 def filter_forex_dict(forex_dict, report_year):
@@ -219,23 +228,12 @@ def apply_rates_transact_dict(trans_dict, daily_rates, monthly_rates):
     for k, v in trans_dict.items():
         for f in v:
             buy_price, sell_price = f.buy_price, f.sell_price
-
-            if f.currency == "EUR":
-                buy_rate_daily = 1
-                buy_rate_monthly = 1
-                sell_rate_daily = 1
-                sell_rate_monthly = 1
-            else:
-                # exchange rates are in 1 EUR : X FOREX
-
-                buy_rate_daily = daily_rates[f.currency][f.buy_date]
-                buy_rate_monthly = monthly_rates[f.currency][
-                    f.buy_date.year, f.buy_date.month
-                ]
-                sell_rate_daily = daily_rates[f.currency][f.sell_date]
-                sell_rate_monthly = monthly_rates[f.currency][
-                    f.sell_date.year, f.sell_date.month
-                ]
+            buy_rate_daily, buy_rate_monthly = get_rates(
+                f.currency, f.buy_date, daily_rates, monthly_rates
+            )
+            sell_rate_daily, sell_rate_monthly = get_rates(
+                f.currency, f.sell_date, daily_rates, monthly_rates
+            )
 
             f.buy_price_eur_daily = buy_price / buy_rate_daily
             f.buy_price_eur_monthly = buy_price / buy_rate_monthly